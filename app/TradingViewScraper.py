@@ -4,7 +4,9 @@ import logging
 import random
 import re
 import string
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import websockets
 import requests
 import json
@@ -12,6 +14,8 @@ import asyncpg
 import os
 import aiohttp
 import asyncio
+import concurrent.futures
+import functools
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +36,92 @@ class Interval(enum.Enum):
     in_monthly = "1M"
 
 
+# Binary COPY layout of one exported row: field count, then (length, value)
+# pairs for dt and the five OHLCV columns cast to float8. All fields are
+# NOT NULL, so every row has the same fixed width and can be decoded in a
+# single np.frombuffer call.
+_COPY_ROW_DTYPE = np.dtype([
+    ("n_fields", ">i2"),
+    ("dt_len", ">i4"), ("dt", ">i8"),
+    ("open_len", ">i4"), ("open", ">f8"),
+    ("high_len", ">i4"), ("high", ">f8"),
+    ("low_len", ">i4"), ("low", ">f8"),
+    ("close_len", ">i4"), ("close", ">f8"),
+    ("volume_len", ">i4"), ("volume", ">f8"),
+])
+_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+# Postgres timestamps are microseconds since 2000-01-01
+_PG_EPOCH_US = np.datetime64("2000-01-01T00:00:00", "us")
+
+
+def _parse_raw_data(raw_data) -> list:
+    """
+    Parses the raw websocket payload into rows of [datetime, open, high, low, close, volume].
+    Kept at module level (not a private method) so it can be pickled into a process pool.
+    """
+    if isinstance(raw_data, bytes):
+        raw_data = raw_data.decode("utf-8")
+    try:
+        out = re.search('"s":\[(.+?)\}\]', raw_data).group(1)
+        x = out.split(',{"')
+        data = list()
+        volume_data = True
+
+        for xi in x:
+            xi = re.split("\[|:|,|\]", xi)
+            ts = datetime.datetime.fromtimestamp(float(xi[4]))
+
+            row = [ts]
+
+            for i in range(5, 10):
+
+                # skip converting volume data if does not exists
+                if not volume_data and i == 9:
+                    row.append(0.0)
+                    continue
+                try:
+                    row.append(float(xi[i]))
+
+                except ValueError:
+                    volume_data = False
+                    row.append(0.0)
+                    logger.debug('no volume data')
+
+            data.append(row)
+        return data
+    except AttributeError:
+        logger.error("Error Parsing Data")
+
+
+def _create_df(data, symbol):
+    try:
+
+        data = pd.DataFrame(
+            data, columns=["datetime", "open",
+                           "high", "low", "close", "volume"]
+        ).set_index("datetime")
+        data.insert(0, "symbol", value=symbol)
+        return data
+    except AttributeError:
+        logger.error("no data, please check the exchange and symbol")
+
+
+def _decode_raw_df(raw_data, symbol):
+    """
+    Parses the raw payload and builds the DataFrame in one call, so a worker
+    only sends back the finished frame.
+    """
+    return _create_df(_parse_raw_data(raw_data), symbol)
+
+
 class TradingViewScraper:
     def __init__(
             self,
             username: str = None,
             password: str = None,
-            db_type: str = "dev"
+            db_type: str = "dev",
+            decode_pool: str = None,
+            decode_workers: int = None
     ) -> None:
         self.ws_timeout = 5
         self.ws_debug = False
@@ -73,6 +157,17 @@ class TradingViewScraper:
 
         self.pool = None
 
+        # Optional worker pool for payload decoding, so large payloads don't stall
+        # other websockets on the event loop. None decodes inline.
+        if decode_pool is None:
+            self.decode_executor = None
+        elif decode_pool == 'thread':
+            self.decode_executor = concurrent.futures.ThreadPoolExecutor(max_workers=decode_workers)
+        elif decode_pool == 'process':
+            self.decode_executor = concurrent.futures.ProcessPoolExecutor(max_workers=decode_workers)
+        else:
+            raise ValueError("decode_pool must be None, 'thread' or 'process'")
+
     async def setup_pool(self):
         self.pool = await asyncpg.create_pool(**self._DB_CONN_INFO)
 
@@ -80,6 +175,25 @@ class TradingViewScraper:
         if self.pool:
             await self.pool.close()
 
+    async def close_decode_pool(self):
+        if self.decode_executor:
+            # shutdown waits for the workers, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.decode_executor.shutdown)
+            self.decode_executor = None
+
+    async def __decode(self, func, raw_data: str, *args):
+        """
+        Runs a decode function on the configured worker pool, or inline if there is none.
+        Worker processes are sent the raw payload as bytes; threads share the string.
+        """
+        if self.decode_executor is None:
+            return func(raw_data, *args)
+        if isinstance(self.decode_executor, concurrent.futures.ProcessPoolExecutor):
+            raw_data = raw_data.encode("utf-8")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.decode_executor, functools.partial(func, raw_data, *args))
+
     def __auth(self, username, password):
         if username is None or password is None:
             token = None
@@ -141,51 +255,6 @@ class TradingViewScraper:
             print(m)
         await ws.send(m)
 
-    @staticmethod
-    def __parse_raw_data(raw_data) -> list:
-        try:
-            out = re.search('"s":\[(.+?)\}\]', raw_data).group(1)
-            x = out.split(',{"')
-            data = list()
-            volume_data = True
-
-            for xi in x:
-                xi = re.split("\[|:|,|\]", xi)
-                ts = datetime.datetime.fromtimestamp(float(xi[4]))
-
-                row = [ts]
-
-                for i in range(5, 10):
-
-                    # skip converting volume data if does not exists
-                    if not volume_data and i == 9:
-                        row.append(0.0)
-                        continue
-                    try:
-                        row.append(float(xi[i]))
-
-                    except ValueError:
-                        volume_data = False
-                        row.append(0.0)
-                        logger.debug('no volume data')
-
-                data.append(row)
-            return data
-        except AttributeError:
-            logger.error("Error Parsing Data")
-
-    def __create_df(self, data, symbol):
-        try:
-
-            data = pd.DataFrame(
-                data, columns=["datetime", "open",
-                               "high", "low", "close", "volume"]
-            ).set_index("datetime")
-            data.insert(0, "symbol", value=symbol)
-            return data
-        except AttributeError:
-            logger.error("no data, please check the exchange and symbol")
-
     async def __insert_candles_db(self, data: list, symbol: str):
         """
         Inserts list of data into the "Candles" table. On Conflicts, it skips.
@@ -224,6 +293,139 @@ class TradingViewScraper:
             async with connection.transaction():
                 await connection.executemany(query, records)
 
+    @staticmethod
+    def __decode_copy_rows(buf: bytearray, header_read: bool) -> (dict, int, bool):
+        """
+        Decodes every whole row currently in a binary COPY buffer of
+        (dt, open, high, low, close, volume) straight into numpy column arrays.
+        Returns the columns, the number of bytes consumed and whether the header has been read.
+        """
+        offset = 0
+        if not header_read:
+            fixed_len = len(_COPY_SIGNATURE) + 8  # signature, flags, extension length
+            if len(buf) < fixed_len:
+                return None, 0, False
+            if buf[:len(_COPY_SIGNATURE)] != _COPY_SIGNATURE:
+                raise ValueError("not a binary COPY stream")
+            ext_len = int.from_bytes(buf[fixed_len - 4:fixed_len], "big")
+            if len(buf) < fixed_len + ext_len:
+                return None, 0, False
+            offset = fixed_len + ext_len
+
+        n_rows = (len(buf) - offset) // _COPY_ROW_DTYPE.itemsize
+        if n_rows == 0:
+            return None, offset, True
+
+        rows = np.frombuffer(buf, dtype=_COPY_ROW_DTYPE, count=n_rows, offset=offset)
+        columns = {"datetime": _PG_EPOCH_US + rows["dt"].astype("i8").astype("m8[us]")}
+        for name in ("open", "high", "low", "close", "volume"):
+            columns[name] = rows[name].astype("f8")
+        return columns, offset + n_rows * _COPY_ROW_DTYPE.itemsize, True
+
+    async def __copy_candles(self, symbol: str, exchange: str, start=None, end=None) -> dict:
+        """
+        Streams candles for a single symbol out of "candles_tv" using binary COPY.
+        NUMERIC columns are cast to float8 server side so they decode without Decimal.
+        """
+        if self.pool is None:
+            await self.setup_pool()
+
+        conditions = ["symbol = $1", "exchange = $2"]
+        args = [symbol, exchange]
+        if start is not None:
+            args.append(start)
+            conditions.append(f"dt >= ${len(args)}")
+        if end is not None:
+            args.append(end)
+            conditions.append(f"dt < ${len(args)}")
+
+        query = f"""
+            SELECT dt, open::float8, high::float8, low::float8, close::float8, volume::float8
+            FROM candles_tv
+            WHERE {' AND '.join(conditions)}
+            ORDER BY dt
+        """
+
+        # Whole rows are decoded as each chunk arrives; only a partial row
+        # (or the trailer) is carried over to the next chunk.
+        pending = bytearray()
+        decoded = []
+        header_read = False
+
+        async def collect(chunk):
+            nonlocal header_read
+            pending.extend(chunk)
+            columns, consumed, header_read = self.__decode_copy_rows(pending, header_read)
+            if columns is not None:
+                decoded.append(columns)
+            del pending[:consumed]
+
+        async with self.pool.acquire() as connection:
+            await connection.copy_from_query(query, *args, output=collect, format="binary")
+
+        # Only the 2 byte -1 end marker should be left over
+        if not header_read or bytes(pending) != b"\xff\xff":
+            raise ValueError("unexpected row layout in COPY stream")
+
+        names = ("datetime", "open", "high", "low", "close", "volume")
+        if not decoded:
+            return {
+                "datetime": np.array([], dtype="datetime64[us]"),
+                **{name: np.array([], dtype="f8") for name in names[1:]}
+            }
+        return {name: np.concatenate([columns[name] for columns in decoded]) for name in names}
+
+    async def export_candles(
+            self,
+            symbol: str,
+            exchange: str = "BINANCE",
+            start: datetime.datetime = None,
+            end: datetime.datetime = None,
+            as_arrow: bool = False,
+    ):
+        """export stored candles
+
+              Args:
+                  symbol (str): symbol name, or EXCHANGE:SYMBOL
+                  exchange (str, optional): exchange, not required if symbol is in format EXCHANGE:SYMBOL. Defaults to 'BINANCE'.
+                  start (datetime, optional): inclusive lower bound on dt. Defaults to None.
+                  end (datetime, optional): exclusive upper bound on dt. Defaults to None.
+                  as_arrow (bool, optional): return a pyarrow Table instead of a DataFrame. Defaults to False.
+
+              Returns:
+                  pd.Dataframe: dataframe with sohlcv as columns, same shape and dtypes as get_historical_df
+              """
+        symbol = self.__format_symbol(symbol=symbol, exchange=exchange)
+        exchange, symbol_ticker = symbol.split(":")
+        columns = await self.__copy_candles(symbol_ticker, exchange, start, end)
+
+        if as_arrow:
+            table = pa.table(columns)
+            return table.add_column(1, "symbol", pa.array([symbol] * table.num_rows, pa.string()))
+
+        # Match the datetime64[ns] index that get_historical_df returns
+        columns["datetime"] = columns["datetime"].astype("datetime64[ns]")
+        data = pd.DataFrame(columns).set_index("datetime")
+        data.insert(0, "symbol", value=symbol)
+        return data
+
+    async def export_multiple_tickers(self, tickers, start=None, end=None, as_arrow=False) -> dict:
+        """
+        Exports several (symbol, exchange) tuples in parallel, each on its own pool connection.
+        Returns a dict keyed by EXCHANGE:SYMBOL.
+        """
+        if self.pool is None:
+            await self.setup_pool()
+        tasks = [
+            self.export_candles(symbol, exchange, start=start, end=end, as_arrow=as_arrow)
+            for symbol, exchange in tickers
+        ]
+        results = await asyncio.gather(*tasks)
+        return {
+            self.__format_symbol(symbol=symbol, exchange=exchange): result
+            for (symbol, exchange), result in zip(tickers, results)
+        }
+
     @staticmethod
     def __format_symbol(symbol, exchange, contract: int = None):
 
@@ -240,7 +442,7 @@ class TradingViewScraper:
 
         return symbol
 
-    async def get_historical_data(
+    async def __fetch_raw_data(
             self,
             symbol: str,
             exchange: str = "NSE",
@@ -248,20 +450,10 @@ class TradingViewScraper:
             n_bars: int = 5000,
             fut_contract: int = None,
             extended_session: bool = False,
-    ) -> (list, str):
-        """get historical data
-
-              Args:
-                  symbol (str): symbol name
-                  exchange (str, optional): exchange, not required if symbol is in format EXCHANGE:SYMBOL. Defaults to None.
-                  interval (str, optional): chart interval. Defaults to 'M'.
-                  n_bars (int, optional): no of bars to download, max 5000. Defaults to 10.
-                  fut_contract (int, optional): None for cash, 1 for continuous current contract in front, 2 for continuous next contract in front . Defaults to None.
-                  extended_session (bool, optional): regular session if False, extended session if True, Defaults to False.
-
-              Returns:
-                  pd.Dataframe: dataframe with sohlcv as columns
-              """
+    ) -> (str, str):
+        """
+        Streams the raw websocket payload for a symbol, leaving decoding to the caller.
+        """
         symbol = self.__format_symbol(
             symbol=symbol, exchange=exchange, contract=fut_contract
         )
@@ -332,20 +524,52 @@ class TradingViewScraper:
             await self.__send_message("switch_timezone", [
                 self.chart_session, "exchange"], websocket)
 
-            raw_data = ""
+            messages = []
 
             logger.debug(f"getting data for {symbol}...")
             while True:
                 try:
                     result = await websocket.recv()
-                    raw_data += result + "\n"
+                    messages.append(result)
                     if "series_completed" in result:
                         break
                 except Exception as e:
                     logger.error(e)
                     break
 
-        data = self.__parse_raw_data(raw_data)
+        return "\n".join(messages), symbol
+
+    async def get_historical_data(
+            self,
+            symbol: str,
+            exchange: str = "NSE",
+            interval: Interval = Interval.in_1_minute,
+            n_bars: int = 5000,
+            fut_contract: int = None,
+            extended_session: bool = False,
+    ) -> (list, str):
+        """get historical data
+
+              Args:
+                  symbol (str): symbol name
+                  exchange (str, optional): exchange, not required if symbol is in format EXCHANGE:SYMBOL. Defaults to None.
+                  interval (str, optional): chart interval. Defaults to 'M'.
+                  n_bars (int, optional): no of bars to download, max 5000. Defaults to 10.
+                  fut_contract (int, optional): None for cash, 1 for continuous current contract in front, 2 for continuous next contract in front . Defaults to None.
+                  extended_session (bool, optional): regular session if False, extended session if True, Defaults to False.
+
+              Returns:
+                  pd.Dataframe: dataframe with sohlcv as columns
+              """
+        raw_data, symbol = await self.__fetch_raw_data(
+            symbol=symbol,
+            exchange=exchange,
+            interval=interval,
+            n_bars=n_bars,
+            fut_contract=fut_contract,
+            extended_session=extended_session
+        )
+        data = await self.__decode(_parse_raw_data, raw_data)
         return data, symbol
 
     async def get_historical_df(
@@ -357,7 +581,7 @@ class TradingViewScraper:
             fut_contract: int = None,
             extended_session: bool = False,
     ) -> pd.DataFrame:
-        raw_data, symbol = await self.get_historical_data(
+        raw_data, symbol = await self.__fetch_raw_data(
             symbol=symbol,
             exchange=exchange,
             interval=interval,
@@ -365,7 +589,7 @@ class TradingViewScraper:
             fut_contract=fut_contract,
             extended_session=extended_session
         )
-        return self.__create_df(raw_data, symbol)
+        return await self.__decode(_decode_raw_df, raw_data, symbol)
 
     async def save_historical_db(
             self,
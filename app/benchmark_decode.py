@@ -0,0 +1,74 @@
+import asyncio
+import math
+import random
+import time
+
+from TradingViewScraper import TradingViewScraper, _decode_raw_df
+
+# Measures how long the event loop stalls while large payloads are decoded,
+# comparing inline decoding against the thread and process decode pools.
+
+N_PAYLOADS = 8
+N_BARS = 20000
+TICK = 0.005
+
+
+def make_payload(n_bars: int) -> str:
+    """
+    Builds a synthetic timescale_update message shaped like the TradingView response.
+    """
+    ts = 1700000000.0
+    bars = []
+    for i in range(n_bars):
+        o = random.uniform(100, 200)
+        bars.append(
+            '{"i":%d,"v":[%.1f,%.4f,%.4f,%.4f,%.4f,%.2f]}'
+            % (i, ts + 60 * i, o, o + 1, o - 1, o + 0.5, random.uniform(0, 1000))
+        )
+    msg = '{"m":"timescale_update","p":["cs_bench",{"sds_1":{"s":[' + ",".join(bars) + '],"ns":{"d":""}}}]}'
+    return "~m~" + str(len(msg)) + "~m~" + msg + "\n~m~0~m~series_completed"
+
+
+async def probe_loop_lag(stop: asyncio.Event) -> list:
+    """
+    Sleeps for TICK repeatedly and records how late each wake-up was.
+    """
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+    return lags
+
+
+async def run(decode_pool: str = None) -> None:
+    tv = TradingViewScraper(decode_pool=decode_pool)
+    payloads = [make_payload(N_BARS) for _ in range(N_PAYLOADS)]
+
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(stop))
+    await asyncio.sleep(TICK)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        # The same dispatch get_historical_df uses, minus the websocket fetch
+        tv._TradingViewScraper__decode(_decode_raw_df, payload, f"BENCH:{i}")
+        for i, payload in enumerate(payloads)
+    ])
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    lags = sorted(await probe)
+    await tv.close_decode_pool()
+
+    # Nearest-rank percentile; inline decoding leaves only a few (long) samples
+    p99 = lags[math.ceil(len(lags) * 0.99) - 1]
+    print(
+        f"{str(decode_pool):>8}: total {elapsed * 1000:8.1f} ms | "
+        f"loop lag max {lags[-1] * 1000:8.1f} ms, p99 {p99 * 1000:8.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    for pool in (None, "thread", "process"):
+        asyncio.run(run(pool))